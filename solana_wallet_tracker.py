@@ -15,21 +15,58 @@ APIs Used:
 - GeckoTerminal API (free, 30 req/min): OHLCV historical data
 - Helius API (requires API key): Wallet transaction parsing
 
+Requirements (Python 3.10+):
+    pip install aiohttp aiolimiter cachetools numpy orjson
+    pip install diskcache  # optional, caches responses and OHLCV data on disk
+    pip install ijson      # optional, streams large trade imports
+    pip install uvloop     # optional, faster event loop
+
 Usage:
-    python solana_wallet_tracker.py
+    python solana_wallet_tracker.py                # all demos
+    python solana_wallet_tracker.py --only gecko   # one of: dex, gecko, trade
 
 For full wallet tracking automation, you need:
 - A Helius API key (free tier available at helius.dev)
 - Or a Solana Tracker API key (solanatracker.io)
 """
 
-import requests
-import json
+import asyncio
+import argparse
+import contextlib
+import functools
+import hashlib
+import io
+import itertools
+import os
+import sys
 import time
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
-from typing import Optional, List, Dict, Any
+from dataclasses import dataclass, field, fields
+from typing import Optional, List, Dict, Any, TextIO, Tuple
 from enum import Enum
+from types import MappingProxyType
+
+import aiohttp
+import numpy as np
+import orjson
+from aiolimiter import AsyncLimiter
+from cachetools import LRUCache, TTLCache
+
+try:
+    import diskcache
+except ImportError:  # responses are simply not cached on disk
+    diskcache = None
+
+try:
+    import ijson
+except ImportError:  # imports load the whole file instead of streaming
+    ijson = None
+
+try:
+    import uvloop
+except ImportError:  # the default asyncio event loop is used
+    uvloop = None
+
 
 
 # ==============================================================================
@@ -45,6 +82,51 @@ class Config:
     DEXSCREENER_RATE_LIMIT = 300
     GECKOTERMINAL_RATE_LIMIT = 30
     
+    # Max token addresses per DexScreener /tokens/v1 request
+    DEXSCREENER_TOKENS_BATCH_SIZE = 30
+    
+    # In-memory cache of GET responses, shared by all clients
+    RESPONSE_CACHE_SIZE = 1024
+    RESPONSE_CACHE_TTL = 60  # seconds
+    
+    # DexScreener / GeckoTerminal GET responses kept on disk across runs
+    # (used when diskcache is installed)
+    HTTP_CACHE_TTL = 60  # seconds
+    
+    # Responses kept per client for conditional (ETag / Last-Modified) GETs
+    CONDITIONAL_CACHE_SIZE = 1024
+    
+    # Max signatures per Helius parse request
+    HELIUS_PARSE_BATCH_SIZE = 100
+    
+    # Max in-flight requests per host
+    DEXSCREENER_CONCURRENCY = 20
+    GECKOTERMINAL_CONCURRENCY = 20
+    HELIUS_CONCURRENCY = 20
+    
+    # Connection pool (shared keep-alive connections)
+    CONNECTION_LIMIT = 100
+    KEEPALIVE_TIMEOUT = 60  # seconds an idle connection stays open
+    DNS_CACHE_TTL = 300  # seconds resolved API hosts are reused
+    REQUEST_TIMEOUT = 30  # seconds for a whole request
+    CONNECT_TIMEOUT = 5  # seconds to get a connection
+    
+    # Retries for rate-limited / unavailable responses and dropped connections
+    MAX_RETRIES = 3
+    RETRY_BACKOFF = 0.5  # seconds, doubled after each attempt
+    RETRY_STATUSES = (429, 502, 503)
+    
+    # Trades checked at once by WalletTracker.get_all_post_sell_performance
+    POST_SELL_CONCURRENCY = 20
+    
+    # On-disk caches (used when diskcache is installed), in the ohlcv/ and
+    # http/ subdirectories
+    CACHE_DIR = ".cache"
+    OHLCV_CACHE_TTL = 600  # seconds; windows closed over a day ago never expire
+    
+    # Trade files larger than this are streamed on import (requires ijson)
+    STREAM_IMPORT_MIN_BYTES = 8 * 1024 * 1024
+    
     # Default chain
     CHAIN_ID = "solana"
     NETWORK = "solana"
@@ -59,7 +141,18 @@ class TradeStatus(Enum):
     CLOSED = "closed"
 
 
-@dataclass
+def _parse_timestamp(value: str) -> float:
+    """
+    Convert an ISO format timestamp to a unix timestamp
+    
+    A trailing "Z" is read as UTC; naive timestamps are taken as local time.
+    """
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value).timestamp()
+
+
+@dataclass(slots=True)
 class Trade:
     """Represents a single trade"""
     id: str
@@ -86,9 +179,43 @@ class Trade:
     pnl_percent: Optional[float] = None
     max_gain_percent: Optional[float] = None
     max_drawdown_percent: Optional[float] = None
+    
+    # (timestamp string, unix timestamp) last parsed for each field (not exported)
+    _buy_parsed: Tuple[Optional[str], float] = field(
+        default=(None, 0.0), init=False, repr=False, compare=False
+    )
+    _sell_parsed: Tuple[Optional[str], float] = field(
+        default=(None, 0.0), init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        # Parse now so a malformed timestamp fails at construction
+        self._buy_parsed = (self.buy_timestamp, _parse_timestamp(self.buy_timestamp))
+        if self.sell_timestamp:
+            self._sell_parsed = (self.sell_timestamp, _parse_timestamp(self.sell_timestamp))
+    
+    @property
+    def buy_unix(self) -> float:
+        """buy_timestamp as a unix timestamp, re-parsed only when it changes"""
+        if self._buy_parsed[0] != self.buy_timestamp:
+            self._buy_parsed = (self.buy_timestamp, _parse_timestamp(self.buy_timestamp))
+        return self._buy_parsed[1]
+    
+    @property
+    def sell_unix(self) -> Optional[float]:
+        """sell_timestamp as a unix timestamp (None while the trade is open)"""
+        if not self.sell_timestamp:
+            return None
+        if self._sell_parsed[0] != self.sell_timestamp:
+            self._sell_parsed = (self.sell_timestamp, _parse_timestamp(self.sell_timestamp))
+        return self._sell_parsed[1]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Trade fields as a dict, without the parsed timestamp caches"""
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.init}
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenData:
     """Token data from DexScreener"""
     address: str
@@ -107,7 +234,241 @@ class TokenData:
 # API CLIENTS
 # ==============================================================================
 
-class DexScreenerAPI:
+def create_session(limit_per_host: int = 20) -> aiohttp.ClientSession:
+    """Create a session with a keep-alive connection pool"""
+    connector = aiohttp.TCPConnector(
+        limit=Config.CONNECTION_LIMIT,
+        limit_per_host=limit_per_host,
+        keepalive_timeout=Config.KEEPALIVE_TIMEOUT,
+        ttl_dns_cache=Config.DNS_CACHE_TTL
+    )
+    timeout = aiohttp.ClientTimeout(total=Config.REQUEST_TIMEOUT, connect=Config.CONNECT_TIMEOUT)
+    return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+
+# GET responses by _cache_key, shared by all clients. Entries are tasks so
+# concurrent requests for the same URL share one round trip.
+_response_cache = TTLCache(maxsize=Config.RESPONSE_CACHE_SIZE, ttl=Config.RESPONSE_CACHE_TTL)
+
+
+def _forget_failed(key: str, task: asyncio.Future):
+    """Drop a finished response task from the cache unless it succeeded"""
+    if (task.cancelled() or task.exception() is not None) and _response_cache.get(key) is task:
+        del _response_cache[key]
+
+
+def _cache_key(url: str, params: Optional[Dict] = None) -> str:
+    """Stable key for a GET request"""
+    raw = f"{url}?{sorted((params or {}).items())}"
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+class BaseAPIClient:
+    """
+    Shared aiohttp session handling for the API clients
+    
+    Clients are meant to be used as async context managers so the
+    underlying connection pool is closed when done:
+    
+        async with DexScreenerAPI() as api:
+            pairs = await api.search_token("BONK")
+    
+    A session can also be passed in (or set with use_session) to share
+    one pool between clients.
+    Subclasses set the `limiter` class attribute to an AsyncLimiter, so every
+    instance talking to the same host draws from one token bucket;
+    `concurrency` caps how many requests are in flight at once.
+    Subclasses whose responses are public set `persist_responses` to keep
+    GET responses under Config.CACHE_DIR/http (with diskcache installed),
+    so repeated runs skip the network.
+    """
+    
+    limiter: Optional[AsyncLimiter] = None
+    persist_responses = False
+    
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None, concurrency: int = 20):
+        self._session = session
+        self._owns_session = session is None
+        self._concurrency = concurrency
+        self._sem = asyncio.Semaphore(concurrency)
+        self._validators = LRUCache(maxsize=Config.CONDITIONAL_CACHE_SIZE)
+        self._http_cache = None
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Session used for requests, created on first use"""
+        if self._session is None:
+            self._session = create_session(self._concurrency)
+            self._owns_session = True
+        return self._session
+    
+    def use_session(self, session: aiohttp.ClientSession):
+        """Send requests through a session owned by the caller"""
+        self._session = session
+        self._owns_session = False
+    
+    @property
+    def http_cache(self) -> Optional["diskcache.Cache"]:
+        """On-disk response cache, opened on first use (None when not persisting)"""
+        if self._http_cache is None and self.persist_responses and diskcache:
+            self._http_cache = diskcache.Cache(os.path.join(Config.CACHE_DIR, "http"))
+        return self._http_cache
+    
+    async def close(self):
+        """Close the session if this client created it, and the disk cache"""
+        if self._session is not None and self._owns_session:
+            await self._session.close()
+            self._session = None
+        if self._http_cache is not None:
+            self._http_cache.close()
+            self._http_cache = None
+    
+    async def _request(self, method: str, url: str, **kwargs) -> Any:
+        """Send a request and return the decoded JSON body"""
+        _, _, body = await self._send(method, url, **kwargs)
+        return self._decode(body, url)
+    
+    async def _send(self, method: str, url: str, **kwargs) -> Tuple[int, Any, bytes]:
+        """
+        Send a request and return its status, headers and raw body
+        
+        Requests hold a concurrency slot and go through the client's limiter.
+        Responses with a status in Config.RETRY_STATUSES, dropped
+        connections and timeouts are retried up to Config.MAX_RETRIES times, waiting for
+        the Retry-After header or an exponential backoff. A final timeout is
+        raised as aiohttp.ServerTimeoutError.
+        """
+        async with self._sem:
+            for attempt in range(Config.MAX_RETRIES + 1):
+                last_attempt = attempt == Config.MAX_RETRIES
+                try:
+                    async with self.limiter or contextlib.nullcontext():
+                        async with self.session.request(method, url, **kwargs) as response:
+                            if response.status not in Config.RETRY_STATUSES or last_attempt:
+                                response.raise_for_status()
+                                return response.status, response.headers, await response.read()
+                            delay = self._retry_delay(response, attempt)
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                    # The server may close an idle keep-alive connection, or stall
+                    if last_attempt:
+                        if isinstance(e, aiohttp.ClientError):
+                            raise
+                        # Surface timeouts as a ClientError like every other failure
+                        raise aiohttp.ServerTimeoutError(f"{method} {url} timed out") from e
+                    delay = Config.RETRY_BACKOFF * 2 ** attempt
+                await asyncio.sleep(delay)
+    
+    @staticmethod
+    def _decode(body: bytes, url: str) -> Any:
+        """
+        Decode a JSON body with orjson (None for an empty body)
+        
+        A body that isn't JSON (e.g. an HTML error page) raises
+        aiohttp.ClientPayloadError, so callers handle it like any other
+        failed request.
+        """
+        if not body or body.isspace():
+            return None
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError as e:
+            raise aiohttp.ClientPayloadError(f"Invalid JSON from {url}: {e}") from e
+    
+    @staticmethod
+    def _retry_delay(response: aiohttp.ClientResponse, attempt: int) -> float:
+        """Seconds to wait before retrying a failed request"""
+        try:
+            return float(response.headers["Retry-After"])
+        except (KeyError, ValueError):
+            return Config.RETRY_BACKOFF * 2 ** attempt
+    
+    async def _get(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        revalidate: bool = False,
+        persist: bool = True
+    ) -> Any:
+        """
+        GET a URL and return the decoded JSON body
+        
+        Responses are cached for Config.RESPONSE_CACHE_TTL seconds across
+        all clients (and Config.HTTP_CACHE_TTL seconds on disk), and
+        concurrent requests for the same URL share one round trip. Once
+        that expires, revalidate makes the request
+        conditional on the ETag/Last-Modified of the previous response;
+        a 304 reuses its body. Pass persist=False for responses the caller
+        caches on disk itself.
+        
+        A shared request runs on the session of the client that started
+        it, so its callers fail if that client's own session is closed
+        while the request is in flight. Clients sharing one session (as
+        in WalletTracker and main()) are not affected. Cancelling one
+        caller does not cancel the request for the others.
+        """
+        key = _cache_key(url, params)
+        task = _response_cache.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(key, url, params, revalidate, persist))
+            # Don't remember failures
+            task.add_done_callback(functools.partial(_forget_failed, key))
+            _response_cache[key] = task
+        
+        return await asyncio.shield(task)
+    
+    async def _fetch(
+        self, key: str, url: str, params: Optional[Dict], revalidate: bool, persist: bool
+    ) -> Any:
+        cache = self.http_cache if persist else None
+        if cache is not None:
+            data = cache.get(key)
+            if data is not None:
+                return data
+        
+        data = await self._fetch_remote(key, url, params, revalidate)
+        if cache is not None and data is not None:
+            cache.set(key, data, expire=Config.HTTP_CACHE_TTL)
+        return data
+    
+    async def _fetch_remote(self, key: str, url: str, params: Optional[Dict], revalidate: bool) -> Any:
+        if not revalidate:
+            return await self._request("GET", url, params=params)
+        
+        cached = self._validators.get(key)
+        headers = {}
+        if cached is not None:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        
+        status, response_headers, body = await self._send("GET", url, params=params, headers=headers)
+        if status == 304 and cached is not None:
+            return cached[2]
+        
+        data = self._decode(body, url)
+        etag = response_headers.get("ETag")
+        last_modified = response_headers.get("Last-Modified")
+        if etag or last_modified:
+            self._validators[key] = (etag, last_modified, data)
+        return data
+    
+    async def _post(self, url: str, payload: Any, params: Optional[Dict] = None) -> Any:
+        """POST a JSON payload (encoded with orjson) and return the decoded JSON body"""
+        return await self._request(
+            "POST", url, data=orjson.dumps(payload), params=params,
+            headers={"Content-Type": "application/json"}
+        )
+
+
+class DexScreenerAPI(BaseAPIClient):
     """
     Client for DexScreener API
     
@@ -123,124 +484,108 @@ class DexScreenerAPI:
     - GET /token-profiles/latest/v1 - Get token profiles (60 req/min)
     """
     
-    def __init__(self):
-        self.base_url = Config.DEXSCREENER_BASE_URL
-        self.last_request_time = 0
-        self.min_request_interval = 60 / Config.DEXSCREENER_RATE_LIMIT
+    limiter = AsyncLimiter(Config.DEXSCREENER_RATE_LIMIT, 60)
+    persist_responses = True
     
-    def _rate_limit(self):
-        """Simple rate limiting"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.min_request_interval:
-            time.sleep(self.min_request_interval - elapsed)
-        self.last_request_time = time.time()
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        super().__init__(session, concurrency=Config.DEXSCREENER_CONCURRENCY)
+        self.base_url = Config.DEXSCREENER_BASE_URL
     
-    def search_token(self, query: str) -> List[Dict]:
+    async def search_token(self, query: str) -> List[Dict]:
         """
         Search for tokens by name or address
         
         Endpoint: GET /latest/dex/search?q={query}
         Rate limit: 300 req/min
         """
-        self._rate_limit()
         url = f"{self.base_url}/latest/dex/search"
         params = {"q": query}
         
         try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            data = await self._get(url, params=params)
             
             # Filter for Solana only
-            pairs = data.get("pairs", [])
+            pairs = (data or {}).get("pairs", [])
             solana_pairs = [p for p in pairs if p.get("chainId") == "solana"]
             return solana_pairs
             
-        except requests.RequestException as e:
+        except aiohttp.ClientError as e:
             print(f"DexScreener search error: {e}")
             return []
     
-    def get_token_pairs(self, token_address: str) -> List[Dict]:
+    async def get_token_pairs(self, token_address: str) -> List[Dict]:
         """
         Get all pools for a token
         
         Endpoint: GET /token-pairs/v1/{chainId}/{tokenAddress}
         Rate limit: 300 req/min
         """
-        self._rate_limit()
         url = f"{self.base_url}/token-pairs/v1/{Config.CHAIN_ID}/{token_address}"
         
         try:
-            response = requests.get(url)
-            response.raise_for_status()
-            return response.json() or []
+            return await self._get(url, revalidate=True) or []
             
-        except requests.RequestException as e:
+        except aiohttp.ClientError as e:
             print(f"DexScreener token pairs error: {e}")
             return []
     
-    def get_pair(self, pair_address: str) -> Optional[Dict]:
+    async def get_pair(self, pair_address: str) -> Optional[Dict]:
         """
         Get specific pair data
         
         Endpoint: GET /latest/dex/pairs/{chainId}/{pairId}
         Rate limit: 300 req/min
         """
-        self._rate_limit()
         url = f"{self.base_url}/latest/dex/pairs/{Config.CHAIN_ID}/{pair_address}"
         
         try:
-            response = requests.get(url)
-            response.raise_for_status()
-            data = response.json()
-            pairs = data.get("pairs", [])
+            data = await self._get(url, revalidate=True)
+            pairs = (data or {}).get("pairs", [])
             return pairs[0] if pairs else None
             
-        except requests.RequestException as e:
+        except aiohttp.ClientError as e:
             print(f"DexScreener pair error: {e}")
             return None
     
-    def get_tokens(self, token_addresses: List[str]) -> List[Dict]:
+    async def get_tokens(self, token_addresses: List[str]) -> List[Dict]:
         """
         Get multiple tokens data (up to 30 addresses)
         
         Endpoint: GET /tokens/v1/{chainId}/{tokenAddresses}
         Rate limit: 300 req/min
         """
-        self._rate_limit()
-        addresses = ",".join(token_addresses[:30])
+        addresses = ",".join(token_addresses[:Config.DEXSCREENER_TOKENS_BATCH_SIZE])
         url = f"{self.base_url}/tokens/v1/{Config.CHAIN_ID}/{addresses}"
         
         try:
-            response = requests.get(url)
-            response.raise_for_status()
-            return response.json() or []
+            return await self._get(url) or []
             
-        except requests.RequestException as e:
+        except aiohttp.ClientError as e:
             print(f"DexScreener tokens error: {e}")
             return []
     
-    def get_latest_boosted(self) -> List[Dict]:
+    async def get_latest_boosted(self) -> List[Dict]:
         """
         Get latest boosted tokens
         
         Endpoint: GET /token-boosts/latest/v1
         Rate limit: 60 req/min
         """
-        self._rate_limit()
         url = f"{self.base_url}/token-boosts/latest/v1"
         
         try:
-            response = requests.get(url)
-            response.raise_for_status()
-            return response.json() or []
+            return await self._get(url) or []
             
-        except requests.RequestException as e:
+        except aiohttp.ClientError as e:
             print(f"DexScreener boosted error: {e}")
             return []
 
 
-class GeckoTerminalAPI:
+_EMPTY_OHLCV = np.empty((0, 6), dtype=np.float64)
+_EMPTY_OHLCV.flags.writeable = False
+
+
+class GeckoTerminalAPI(BaseAPIClient):
     """
     Client for GeckoTerminal API
     
@@ -254,26 +599,36 @@ class GeckoTerminalAPI:
     - GET /networks/{network}/pools/{address}/trades - Recent trades
     """
     
-    def __init__(self):
+    limiter = AsyncLimiter(Config.GECKOTERMINAL_RATE_LIMIT, 60)
+    persist_responses = True
+    
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        super().__init__(session, concurrency=Config.GECKOTERMINAL_CONCURRENCY)
         self.base_url = Config.GECKOTERMINAL_BASE_URL
-        self.last_request_time = 0
-        self.min_request_interval = 60 / Config.GECKOTERMINAL_RATE_LIMIT
+        self._cache = None
     
-    def _rate_limit(self):
-        """Simple rate limiting"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.min_request_interval:
-            time.sleep(self.min_request_interval - elapsed)
-        self.last_request_time = time.time()
+    @property
+    def cache(self) -> Optional["diskcache.Cache"]:
+        """On-disk OHLCV cache, opened on first use (None without diskcache)"""
+        if self._cache is None and diskcache:
+            self._cache = diskcache.Cache(os.path.join(Config.CACHE_DIR, "ohlcv"))
+        return self._cache
     
-    def get_ohlcv(
+    async def close(self):
+        await super().close()
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
+    
+    async def get_ohlcv(
         self,
         pool_address: str,
         timeframe: str = "hour",
         aggregate: int = 1,
         limit: int = 100,
-        currency: str = "usd"
-    ) -> List[List]:
+        currency: str = "usd",
+        before_timestamp: Optional[int] = None
+    ) -> np.ndarray:
         """
         Get OHLCV candlestick data for a pool
         
@@ -285,110 +640,121 @@ class GeckoTerminalAPI:
             aggregate: Aggregation period (1, 4, 12 for hours; 1, 5, 15 for minutes)
             limit: Number of candles (max 1000)
             currency: "usd" or "token"
+            before_timestamp: Only return candles before this unix timestamp
         
         Returns:
-            List of [timestamp, open, high, low, close, volume]
+            float64 array of shape (N, 6), one
+            [timestamp, open, high, low, close, volume] row per candle
+        
+        Results are cached on disk for Config.OHLCV_CACHE_TTL seconds, or
+        indefinitely when before_timestamp is more than a day in the past.
         """
-        self._rate_limit()
+        key = f"ohlcv:{pool_address}:{timeframe}:{aggregate}:{limit}:{currency}:{before_timestamp}"
+        cache = self.cache
+        if cache is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return np.asarray(cached, dtype=np.float64)
+        
         url = f"{self.base_url}/networks/{Config.NETWORK}/pools/{pool_address}/ohlcv/{timeframe}"
         params = {
             "aggregate": aggregate,
             "limit": limit,
             "currency": currency
         }
+        if before_timestamp:
+            params["before_timestamp"] = before_timestamp
         
         try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            return data.get("data", {}).get("attributes", {}).get("ohlcv_list", [])
+            # Cached above as an array, so skip the on-disk response cache
+            data = await self._get(url, params=params, persist=False)
+            ohlcv_list = (data or {}).get("data", {}).get("attributes", {}).get("ohlcv_list", [])
             
-        except requests.RequestException as e:
+        except aiohttp.ClientError as e:
             print(f"GeckoTerminal OHLCV error: {e}")
-            return []
+            return _EMPTY_OHLCV
+        
+        # Parse straight into one contiguous array instead of keeping
+        # a Python list per candle
+        ohlcv = np.array(ohlcv_list, dtype=np.float64).reshape(-1, 6)
+        
+        if cache is not None and len(ohlcv):
+            # Candles for a window that closed long ago won't change
+            historical = before_timestamp and before_timestamp < time.time() - 86400
+            cache.set(key, ohlcv, expire=None if historical else Config.OHLCV_CACHE_TTL)
+        
+        return ohlcv
     
-    def get_pool(self, pool_address: str) -> Optional[Dict]:
+    async def get_pool(self, pool_address: str) -> Optional[Dict]:
         """
         Get pool information
         
         Endpoint: GET /networks/{network}/pools/{pool_address}
         """
-        self._rate_limit()
         url = f"{self.base_url}/networks/{Config.NETWORK}/pools/{pool_address}"
         
         try:
-            response = requests.get(url)
-            response.raise_for_status()
-            data = response.json()
-            return data.get("data", {}).get("attributes")
+            data = await self._get(url)
+            return (data or {}).get("data", {}).get("attributes")
             
-        except requests.RequestException as e:
+        except aiohttp.ClientError as e:
             print(f"GeckoTerminal pool error: {e}")
             return None
     
-    def search_pools(self, query: str) -> List[Dict]:
+    async def search_pools(self, query: str) -> List[Dict]:
         """
         Search for pools
         
         Endpoint: GET /search/pools?query={query}
         """
-        self._rate_limit()
         url = f"{self.base_url}/search/pools"
         params = {"query": query}
         
         try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            return data.get("data", [])
+            data = await self._get(url, params=params)
+            return (data or {}).get("data", [])
             
-        except requests.RequestException as e:
+        except aiohttp.ClientError as e:
             print(f"GeckoTerminal search error: {e}")
             return []
     
-    def get_token_pools(self, token_address: str) -> List[Dict]:
+    async def get_token_pools(self, token_address: str) -> List[Dict]:
         """
         Get all pools for a token on Solana
         
         Endpoint: GET /networks/{network}/tokens/{token_address}/pools
         """
-        self._rate_limit()
         url = f"{self.base_url}/networks/{Config.NETWORK}/tokens/{token_address}/pools"
         
         try:
-            response = requests.get(url)
-            response.raise_for_status()
-            data = response.json()
-            return data.get("data", [])
+            data = await self._get(url)
+            return (data or {}).get("data", [])
             
-        except requests.RequestException as e:
+        except aiohttp.ClientError as e:
             print(f"GeckoTerminal token pools error: {e}")
             return []
     
-    def get_trades(self, pool_address: str, trade_volume_min: float = 0) -> List[Dict]:
+    async def get_trades(self, pool_address: str, trade_volume_min: float = 0) -> List[Dict]:
         """
         Get recent trades for a pool
         
         Endpoint: GET /networks/{network}/pools/{pool_address}/trades
         """
-        self._rate_limit()
         url = f"{self.base_url}/networks/{Config.NETWORK}/pools/{pool_address}/trades"
         params = {}
         if trade_volume_min > 0:
             params["trade_volume_in_usd_greater_than"] = trade_volume_min
         
         try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            return data.get("data", [])
+            data = await self._get(url, params=params)
+            return (data or {}).get("data", [])
             
-        except requests.RequestException as e:
+        except aiohttp.ClientError as e:
             print(f"GeckoTerminal trades error: {e}")
             return []
 
 
-class HeliusAPI:
+class HeliusAPI(BaseAPIClient):
     """
     Client for Helius API (requires API key)
     
@@ -400,11 +766,15 @@ class HeliusAPI:
     - Real-time webhooks for trade detection
     """
     
-    def __init__(self, api_key: str):
+    # Wallet data fetched with the user's API key is never written to disk
+    persist_responses = False
+    
+    def __init__(self, api_key: str, session: Optional[aiohttp.ClientSession] = None):
+        super().__init__(session, concurrency=Config.HELIUS_CONCURRENCY)
         self.api_key = api_key
         self.base_url = Config.HELIUS_BASE_URL
     
-    def get_wallet_transactions(
+    async def get_wallet_transactions(
         self,
         wallet_address: str,
         tx_type: Optional[str] = None,
@@ -426,28 +796,33 @@ class HeliusAPI:
             params["type"] = tx_type
         
         try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
+            return await self._get(url, params=params)
             
-        except requests.RequestException as e:
+        except aiohttp.ClientError as e:
             print(f"Helius transactions error: {e}")
             return []
     
-    def parse_transactions(self, signatures: List[str]) -> List[Dict]:
+    async def parse_transactions(self, signatures: List[str]) -> List[Dict]:
         """
         Parse raw transaction signatures into human-readable format
+        
+        Signatures are sent in concurrent batches of
+        Config.HELIUS_PARSE_BATCH_SIZE; results keep the input order.
         """
+        size = Config.HELIUS_PARSE_BATCH_SIZE
+        chunks = [signatures[i:i + size] for i in range(0, len(signatures), size)]
+        results = await asyncio.gather(*[self._parse_chunk(c) for c in chunks])
+        return list(itertools.chain.from_iterable(results))
+    
+    async def _parse_chunk(self, signatures: List[str]) -> List[Dict]:
         url = f"{self.base_url}/transactions/"
         params = {"api-key": self.api_key}
         payload = {"transactions": signatures}
         
         try:
-            response = requests.post(url, json=payload, params=params)
-            response.raise_for_status()
-            return response.json()
+            return await self._post(url, payload, params=params)
             
-        except requests.RequestException as e:
+        except aiohttp.ClientError as e:
             print(f"Helius parse error: {e}")
             return []
 
@@ -456,83 +831,137 @@ class HeliusAPI:
 # TRADE ANALYZER
 # ==============================================================================
 
+def _candle_window(candles: np.ndarray, lo_ts: float, hi_ts: float) -> np.ndarray:
+    """
+    Slice of the candles with lo_ts <= timestamp <= hi_ts
+    
+    Candles come sorted by time (GeckoTerminal returns newest first), so the
+    range is contiguous and located with a binary search rather than a mask.
+    The slice keeps the input order.
+    """
+    n = len(candles)
+    descending = n > 1 and candles[0, 0] > candles[-1, 0]
+    timestamps = candles[::-1, 0] if descending else candles[:, 0]
+    lo = int(np.searchsorted(timestamps, lo_ts, side="left"))
+    hi = int(np.searchsorted(timestamps, hi_ts, side="right"))
+    return candles[n - hi:n - lo] if descending else candles[lo:hi]
+
+
+def _scan_min_max(candles: np.ndarray) -> Tuple[float, float, float, float]:
+    """
+    Find the lowest low and highest high in a non-empty set of candles
+    
+    Returns:
+        (min_price, min_ts, max_price, max_ts)
+    """
+    i_min = int(candles[:, 3].argmin())
+    i_max = int(candles[:, 2].argmax())
+    return candles[i_min, 3], candles[i_min, 0], candles[i_max, 2], candles[i_max, 0]
+
+
 class TradeAnalyzer:
-    """Analyzes trade performance using historical data"""
+    """
+    Analyzes trade performance using historical data
     
-    def __init__(self):
-        self.dexscreener = DexScreenerAPI()
-        self.geckoterminal = GeckoTerminalAPI()
+    Pass in existing clients to share their sessions; clients created
+    here are owned (and closed) by the analyzer.
+    """
+    
+    def __init__(
+        self,
+        session: Optional[aiohttp.ClientSession] = None,
+        dexscreener: Optional[DexScreenerAPI] = None,
+        geckoterminal: Optional[GeckoTerminalAPI] = None
+    ):
+        self._owned_clients: List[BaseAPIClient] = []
+        if dexscreener is None:
+            dexscreener = DexScreenerAPI(session)
+            self._owned_clients.append(dexscreener)
+        if geckoterminal is None:
+            geckoterminal = GeckoTerminalAPI(session)
+            self._owned_clients.append(geckoterminal)
+        self.dexscreener = dexscreener
+        self.geckoterminal = geckoterminal
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    def use_session(self, session: aiohttp.ClientSession):
+        """Send requests through a session owned by the caller"""
+        for client in self._owned_clients:
+            client.use_session(session)
+    
+    async def close(self):
+        """Close the API clients created by the analyzer"""
+        for client in self._owned_clients:
+            await client.close()
     
-    def analyze_trade(self, trade: Trade) -> Trade:
+    async def analyze_trade(self, trade: Trade, file: Optional[TextIO] = None) -> Trade:
         """
         Analyze a trade to find min/max prices during holding period
         
         Args:
             trade: Trade object with buy details
+            file: Where to print notices (stdout by default)
         
         Returns:
             Trade object with analysis results filled in
         """
+        ohlcv = await self.fetch_ohlcv(trade)
+        return self.apply_ohlcv(trade, ohlcv, file=file)
+    
+    def _holding_period(self, trade: Trade) -> Tuple[float, float]:
+        """Unix timestamps of the buy and the sell (now for open trades)"""
+        sell_unix = trade.sell_unix
+        return trade.buy_unix, sell_unix if sell_unix is not None else time.time()
+    
+    async def fetch_ohlcv(self, trade: Trade) -> np.ndarray:
+        """Get the hourly OHLCV candles covering a trade's holding period"""
         if not trade.pool_address:
-            print(f"No pool address for {trade.token_symbol}")
-            return trade
+            return _EMPTY_OHLCV
         
-        # Get OHLCV data
-        ohlcv = self.geckoterminal.get_ohlcv(
+        _, sell_timestamp = self._holding_period(trade)
+        
+        # End at the sell for closed trades
+        # (before_timestamp is exclusive, so include the sell candle)
+        return await self.geckoterminal.get_ohlcv(
             trade.pool_address,
             timeframe="hour",
             aggregate=1,
-            limit=1000
+            limit=1000,
+            before_timestamp=int(sell_timestamp) + 1 if trade.sell_timestamp else None
         )
+    
+    def apply_ohlcv(self, trade: Trade, ohlcv: np.ndarray, file: Optional[TextIO] = None) -> Trade:
+        """
+        Fill in a trade's min/max analysis from already fetched candles
         
-        if not ohlcv:
-            print(f"No OHLCV data for {trade.token_symbol}")
+        This is the CPU-only half of analyze_trade, see fetch_ohlcv
+        """
+        if not trade.pool_address:
+            print(f"No pool address for {trade.token_symbol}", file=file)
             return trade
         
-        # Parse timestamps
-        try:
-            buy_time = datetime.fromisoformat(trade.buy_timestamp.replace("Z", "+00:00"))
-        except:
-            buy_time = datetime.fromisoformat(trade.buy_timestamp)
-        buy_timestamp = buy_time.timestamp()
+        if not len(ohlcv):
+            print(f"No OHLCV data for {trade.token_symbol}", file=file)
+            return trade
         
-        if trade.sell_timestamp:
-            try:
-                sell_time = datetime.fromisoformat(trade.sell_timestamp.replace("Z", "+00:00"))
-            except:
-                sell_time = datetime.fromisoformat(trade.sell_timestamp)
-            sell_timestamp = sell_time.timestamp()
-        else:
-            sell_timestamp = time.time()
+        buy_timestamp, sell_timestamp = self._holding_period(trade)
         
         # Filter candles within holding period
         # OHLCV format: [timestamp, open, high, low, close, volume]
-        relevant_candles = []
-        for candle in ohlcv:
-            candle_time = candle[0]  # Unix timestamp in seconds
-            if buy_timestamp <= candle_time <= sell_timestamp:
-                relevant_candles.append(candle)
-        
-        if not relevant_candles:
-            print(f"No candles in holding period for {trade.token_symbol}")
-            return trade
+        candles = np.asarray(ohlcv, dtype=np.float64)
+        relevant_candles = _candle_window(candles, buy_timestamp, sell_timestamp)
         
-        # Calculate min/max
-        min_price = float('inf')
-        max_price = float('-inf')
-        min_ts = None
-        max_ts = None
+        if not len(relevant_candles):
+            print(f"No candles in holding period for {trade.token_symbol}", file=file)
+            return trade
         
-        for candle in relevant_candles:
-            ts, open_p, high, low, close, vol = candle
-            
-            if low < min_price:
-                min_price = low
-                min_ts = ts
-            
-            if high > max_price:
-                max_price = high
-                max_ts = ts
+        # Calculate min/max (low and high columns)
+        min_price, min_ts, max_price, max_ts = map(float, _scan_min_max(relevant_candles))
         
         # Update trade with analysis
         trade.min_price = min_price
@@ -550,14 +979,48 @@ class TradeAnalyzer:
         
         return trade
     
-    def get_current_price(self, token_address: str) -> Optional[float]:
-        """Get current price for a token"""
-        pairs = self.dexscreener.get_token_pairs(token_address)
+    async def get_current_price(self, token_address: str) -> Optional[float]:
+        """
+        Get current price for a token
+        
+        The token-pairs response is cached (Config.RESPONSE_CACHE_TTL in
+        memory, Config.HTTP_CACHE_TTL on disk), so a price right after
+        analyzing the trade doesn't cost another request.
+        """
+        pairs = await self.dexscreener.get_token_pairs(token_address)
         if pairs:
             return float(pairs[0].get("priceUsd", 0))
         return None
     
-    def get_post_sell_performance(self, trade: Trade) -> Dict:
+    async def get_token_pairs_batch(self, token_addresses: List[str]) -> Dict[str, Dict]:
+        """
+        Get the top pair for many tokens using batched /tokens/v1 requests
+        
+        Returns:
+            Dict mapping token address to its first (most liquid) pair
+        """
+        addresses = list(dict.fromkeys(token_addresses))
+        size = Config.DEXSCREENER_TOKENS_BATCH_SIZE
+        chunks = [addresses[i:i + size] for i in range(0, len(addresses), size)]
+        results = await asyncio.gather(*[self.dexscreener.get_tokens(c) for c in chunks])
+        
+        pairs_by_token: Dict[str, Dict] = {}
+        for pairs in results:
+            for pair in pairs:
+                address = pair.get("baseToken", {}).get("address")
+                if address and address not in pairs_by_token:
+                    pairs_by_token[address] = pair
+        return pairs_by_token
+    
+    async def get_current_prices(self, token_addresses: List[str]) -> Dict[str, float]:
+        """Get current prices for many tokens in ceil(N/30) requests"""
+        pairs_by_token = await self.get_token_pairs_batch(token_addresses)
+        return {
+            address: float(pair.get("priceUsd") or 0)
+            for address, pair in pairs_by_token.items()
+        }
+    
+    async def get_post_sell_performance(self, trade: Trade) -> Dict:
         """
         Track token performance after selling
         
@@ -569,7 +1032,7 @@ class TradeAnalyzer:
         if not trade.sell_price or not trade.token_address:
             return {}
         
-        current_price = self.get_current_price(trade.token_address)
+        current_price = await self.get_current_price(trade.token_address)
         if not current_price:
             return {}
         
@@ -587,21 +1050,69 @@ class TradeAnalyzer:
 # WALLET TRACKER
 # ==============================================================================
 
+# Report and demo section headers
+_SEP = "=" * 60
+_HEADER_FMT = f"\n{_SEP}\n{{title}}\n{_SEP}"
+
+
 class WalletTracker:
     """
     Tracks wallet trades on Solana
     
     Note: For automatic trade detection, you need a Helius API key
+    
+    Used as an async context manager, all clients share one keep-alive
+    connection pool. The analyzer reuses the tracker's clients; rate limits
+    are shared per API regardless.
     """
     
-    def __init__(self, helius_api_key: Optional[str] = None):
-        self.dexscreener = DexScreenerAPI()
-        self.geckoterminal = GeckoTerminalAPI()
-        self.helius = HeliusAPI(helius_api_key) if helius_api_key else None
-        self.analyzer = TradeAnalyzer()
+    def __init__(
+        self,
+        helius_api_key: Optional[str] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        dexscreener: Optional[DexScreenerAPI] = None,
+        geckoterminal: Optional[GeckoTerminalAPI] = None
+    ):
+        self._session = session
+        self._owns_session = False
+        self._owned_clients: List[BaseAPIClient] = []
+        if dexscreener is None:
+            dexscreener = DexScreenerAPI(session)
+            self._owned_clients.append(dexscreener)
+        if geckoterminal is None:
+            geckoterminal = GeckoTerminalAPI(session)
+            self._owned_clients.append(geckoterminal)
+        self.dexscreener = dexscreener
+        self.geckoterminal = geckoterminal
+        self.helius = HeliusAPI(helius_api_key, session) if helius_api_key else None
+        if self.helius:
+            self._owned_clients.append(self.helius)
+        self.analyzer = TradeAnalyzer(
+            dexscreener=self.dexscreener,
+            geckoterminal=self.geckoterminal
+        )
         self.trades: List[Trade] = []
     
-    def add_manual_trade(
+    async def __aenter__(self):
+        if self._session is None:
+            self._session = create_session()
+            self._owns_session = True
+            for client in self._owned_clients:
+                client.use_session(self._session)
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    async def close(self):
+        """Close the API clients created by the tracker"""
+        for client in self._owned_clients:
+            await client.close()
+        if self._session is not None and self._owns_session:
+            await self._session.close()
+            self._session = None
+    
+    async def add_manual_trade(
         self,
         token_address: str,
         buy_price: float,
@@ -629,7 +1140,7 @@ class WalletTracker:
             Trade object
         """
         # Get token info from DexScreener
-        pairs = self.dexscreener.get_token_pairs(token_address)
+        pairs = await self.dexscreener.get_token_pairs(token_address)
         
         if not pairs:
             raise ValueError(f"Token not found: {token_address}")
@@ -657,7 +1168,7 @@ class WalletTracker:
         self.trades.append(trade)
         return trade
     
-    def detect_wallet_trades(self, wallet_address: str) -> List[Trade]:
+    async def detect_wallet_trades(self, wallet_address: str) -> List[Trade]:
         """
         Automatically detect trades from a wallet using Helius API
         
@@ -667,7 +1178,7 @@ class WalletTracker:
             raise ValueError("Helius API key required for automatic trade detection")
         
         # Get swap transactions
-        swaps = self.helius.get_wallet_transactions(
+        swaps = await self.helius.get_wallet_transactions(
             wallet_address,
             tx_type="SWAP",
             limit=100
@@ -684,98 +1195,136 @@ class WalletTracker:
         
         return detected_trades
     
-    def analyze_all_trades(self):
-        """Analyze all trades to find min/max prices"""
-        for i, trade in enumerate(self.trades):
-            print(f"Analyzing trade {i+1}/{len(self.trades)}: {trade.token_symbol}")
-            self.trades[i] = self.analyzer.analyze_trade(trade)
+    async def analyze_all_trades(self, file: Optional[TextIO] = None):
+        """Analyze all trades concurrently to find min/max prices (notices go to `file`)"""
+        # Resolve missing pools with one batched lookup instead of one per token
+        missing = [t.token_address for t in self.trades if not t.pool_address]
+        if missing:
+            pairs_by_token = await self.analyzer.get_token_pairs_batch(missing)
+            for trade in self.trades:
+                pair = pairs_by_token.get(trade.token_address)
+                if not trade.pool_address and pair:
+                    trade.pool_address = pair.get("pairAddress", "")
+                    trade.dex_id = trade.dex_id or pair.get("dexId", "")
+        
+        print(f"Analyzing {len(self.trades)} trades...", file=file)
+        
+        # Fetches run concurrently (paced by the client limiters) and each
+        # trade's candles are analyzed, then released, as soon as they arrive
+        await asyncio.gather(*[self.analyzer.analyze_trade(t, file=file) for t in self.trades])
+    
+    async def get_all_post_sell_performance(self) -> List[Dict]:
+        """Post-sell performance of every trade, in trade order"""
+        sem = asyncio.Semaphore(Config.POST_SELL_CONCURRENCY)
+        return await asyncio.gather(*[self._post_sell_one(t, sem) for t in self.trades])
+    
+    async def _post_sell_one(self, trade: Trade, sem: asyncio.Semaphore) -> Dict:
+        async with sem:
+            return await self.analyzer.get_post_sell_performance(trade)
     
     def get_portfolio_summary(self) -> Dict:
         """Get summary statistics for all trades"""
         if not self.trades:
             return {}
         
-        closed_trades = [t for t in self.trades if t.status == "closed"]
-        open_trades = [t for t in self.trades if t.status == "open"]
-        
-        winners = [t for t in closed_trades if t.sell_price and t.sell_price > t.buy_price]
-        win_rate = len(winners) / len(closed_trades) * 100 if closed_trades else 0
-        
-        total_invested = sum(t.buy_amount_usd for t in self.trades if t.buy_amount_usd)
-        
+        # Single pass over the trades
+        n_open = n_closed = n_winners = 0
+        total_invested = 0
         total_pnl = 0
-        for t in closed_trades:
-            if t.pnl_percent:
-                total_pnl += (t.buy_amount_usd or 0) * (t.pnl_percent / 100)
+        pnl_sum = 0
         
-        avg_pnl = sum(t.pnl_percent or 0 for t in closed_trades) / len(closed_trades) if closed_trades else 0
+        for t in self.trades:
+            if t.buy_amount_usd:
+                total_invested += t.buy_amount_usd
+            
+            if t.status == "open":
+                n_open += 1
+            elif t.status == "closed":
+                n_closed += 1
+                if t.sell_price and t.sell_price > t.buy_price:
+                    n_winners += 1
+                if t.pnl_percent:
+                    total_pnl += (t.buy_amount_usd or 0) * (t.pnl_percent / 100)
+                    pnl_sum += t.pnl_percent
+        
+        win_rate = n_winners / n_closed * 100 if n_closed else 0
+        avg_pnl = pnl_sum / n_closed if n_closed else 0
         
         return {
             "total_trades": len(self.trades),
-            "open_trades": len(open_trades),
-            "closed_trades": len(closed_trades),
+            "open_trades": n_open,
+            "closed_trades": n_closed,
             "win_rate": win_rate,
             "total_invested": total_invested,
             "total_pnl": total_pnl,
             "avg_pnl_percent": avg_pnl
         }
     
-    def print_trade_report(self, trade: Trade):
-        """Print detailed trade report"""
-        print("\n" + "="*60)
-        print(f"TRADE REPORT: {trade.token_symbol} ({trade.token_name})")
-        print("="*60)
-        print(f"Status: {trade.status.upper()}")
-        print(f"DEX: {trade.dex_id}")
-        print(f"Token: {trade.token_address}")
-        print(f"Pool: {trade.pool_address}")
-        print("-"*60)
-        print("BUY DETAILS:")
-        print(f"  Price: ${trade.buy_price:.10f}")
-        print(f"  Amount: ${trade.buy_amount_usd:.2f}")
-        print(f"  Market Cap: ${trade.buy_market_cap:,.0f}" if trade.buy_market_cap else "  Market Cap: N/A")
-        print(f"  Time: {trade.buy_timestamp}")
+    def print_trade_report(self, trade: Trade, file: Optional[TextIO] = None):
+        """Print detailed trade report (to stdout unless `file` is given)"""
+        print(_HEADER_FMT.format(title=f"TRADE REPORT: {trade.token_symbol} ({trade.token_name})"), file=file)
+        print(f"Status: {trade.status.upper()}", file=file)
+        print(f"DEX: {trade.dex_id}", file=file)
+        print(f"Token: {trade.token_address}", file=file)
+        print(f"Pool: {trade.pool_address}", file=file)
+        print("-"*60, file=file)
+        print("BUY DETAILS:", file=file)
+        print(f"  Price: ${trade.buy_price:.10f}", file=file)
+        print(f"  Amount: ${trade.buy_amount_usd:.2f}", file=file)
+        print(f"  Market Cap: ${trade.buy_market_cap:,.0f}" if trade.buy_market_cap else "  Market Cap: N/A", file=file)
+        print(f"  Time: {trade.buy_timestamp}", file=file)
         
         if trade.sell_price:
-            print("-"*60)
-            print("SELL DETAILS:")
-            print(f"  Price: ${trade.sell_price:.10f}")
-            print(f"  Amount: ${trade.sell_amount_usd:.2f}" if trade.sell_amount_usd else "  Amount: N/A")
-            print(f"  Time: {trade.sell_timestamp}")
+            print("-"*60, file=file)
+            print("SELL DETAILS:", file=file)
+            print(f"  Price: ${trade.sell_price:.10f}", file=file)
+            print(f"  Amount: ${trade.sell_amount_usd:.2f}" if trade.sell_amount_usd else "  Amount: N/A", file=file)
+            print(f"  Time: {trade.sell_timestamp}", file=file)
         
         if trade.min_price is not None:
-            print("-"*60)
-            print("PERFORMANCE ANALYSIS:")
-            print(f"  Max Price: ${trade.max_price:.10f} ({trade.max_gain_percent:+.2f}%)")
-            print(f"  Min Price: ${trade.min_price:.10f} ({trade.max_drawdown_percent:+.2f}%)")
+            print("-"*60, file=file)
+            print("PERFORMANCE ANALYSIS:", file=file)
+            print(f"  Max Price: ${trade.max_price:.10f} ({trade.max_gain_percent:+.2f}%)", file=file)
+            print(f"  Min Price: ${trade.min_price:.10f} ({trade.max_drawdown_percent:+.2f}%)", file=file)
             if trade.pnl_percent is not None:
                 pnl_emoji = "✅" if trade.pnl_percent > 0 else "❌"
-                print(f"  Realized P&L: {trade.pnl_percent:+.2f}% {pnl_emoji}")
+                print(f"  Realized P&L: {trade.pnl_percent:+.2f}% {pnl_emoji}", file=file)
                 
                 # Calculate how much of max gain was captured
                 if trade.max_gain_percent and trade.max_gain_percent > 0:
                     captured = (trade.pnl_percent / trade.max_gain_percent) * 100
-                    print(f"  % of Max Captured: {captured:.1f}%")
+                    print(f"  % of Max Captured: {captured:.1f}%", file=file)
         
         if trade.notes:
-            print("-"*60)
-            print(f"Notes: {trade.notes}")
+            print("-"*60, file=file)
+            print(f"Notes: {trade.notes}", file=file)
         
-        print("="*60 + "\n")
+        print(_SEP + "\n", file=file)
     
     def export_trades(self, filename: str = "trades.json"):
         """Export trades to JSON file"""
-        data = [asdict(t) for t in self.trades]
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(
+                self.trades,
+                default=Trade.to_dict,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATACLASS
+            ))
         print(f"Exported {len(self.trades)} trades to {filename}")
     
     def import_trades(self, filename: str = "trades.json"):
-        """Import trades from JSON file"""
-        with open(filename, 'r') as f:
-            data = json.load(f)
+        """
+        Import trades from JSON file
+        
+        Files over Config.STREAM_IMPORT_MIN_BYTES are parsed one trade at a
+        time when ijson is installed, instead of loading the whole document.
+        """
+        with open(filename, 'rb') as f:
+            if ijson and os.path.getsize(filename) > Config.STREAM_IMPORT_MIN_BYTES:
+                records = ijson.items(f, "item", use_float=True)
+            else:
+                records = orjson.loads(f.read())
+            self.trades = [Trade(**t) for t in records]
         
-        self.trades = [Trade(**t) for t in data]
         print(f"Imported {len(self.trades)} trades from {filename}")
 
 
@@ -783,131 +1332,170 @@ class WalletTracker:
 # EXAMPLE USAGE
 # ==============================================================================
 
-def demo_dexscreener():
+BONK_ADDRESS = "DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263"
+BONK_POOL = "Gk9CfaWVY9y6wbfHqnDtMnLG5QJNquUxY7hcLc6NPv9P"  # BONK/SOL
+
+# Sample trade for demo_trade_tracking (read-only, passed as **kwargs)
+_BONK_TRADE_KW = MappingProxyType({
+    "token_address": BONK_ADDRESS,
+    "buy_price": 0.00003,
+    "buy_amount_usd": 100,
+    "buy_timestamp": "2024-01-15T10:00:00Z",
+    "sell_price": 0.00004,
+    "sell_amount_usd": 133,
+    "sell_timestamp": "2024-01-20T15:00:00Z",
+    "notes": "BONK memecoin trade",
+})
+
+# Latest-candle block printed by demo_geckoterminal
+_CANDLE_TMPL = (
+    "   Latest candle:\n"
+    "   - Time: {time}\n"
+    "   - Open: ${open:.10f}\n"
+    "   - High: ${high:.10f}\n"
+    "   - Low: ${low:.10f}\n"
+    "   - Close: ${close:.10f}\n"
+    "   - Volume: ${volume:,.2f}\n"
+)
+
+
+@contextlib.contextmanager
+def _buffered_output():
+    """
+    Collect a demo's output and write it to stdout in one call
+    
+    Keeps each demo's lines together when demos run concurrently.
+    """
+    out = io.StringIO()
+    try:
+        yield out
+    finally:
+        sys.stdout.write(out.getvalue())
+        sys.stdout.flush()
+
+
+async def demo_dexscreener(session: Optional[aiohttp.ClientSession] = None):
     """Demonstrate DexScreener API usage"""
-    print("\n" + "="*60)
-    print("DEXSCREENER API DEMO")
-    print("="*60)
-    
-    api = DexScreenerAPI()
-    
-    # Search for a token
-    print("\n1. Searching for 'BONK'...")
-    results = api.search_token("BONK")
-    if results:
-        print(f"   Found {len(results)} pairs")
-        pair = results[0]
-        print(f"   Top result: {pair['baseToken']['symbol']} - ${pair.get('priceUsd', 'N/A')}")
-        print(f"   Market Cap: ${pair.get('marketCap', 0):,.0f}")
-        print(f"   DEX: {pair.get('dexId')}")
-    
-    # Get token pairs by address (BONK token)
-    bonk_address = "DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263"
-    print(f"\n2. Getting pairs for BONK ({bonk_address[:20]}...)...")
-    pairs = api.get_token_pairs(bonk_address)
-    if pairs:
-        print(f"   Found {len(pairs)} pools")
-        for i, p in enumerate(pairs[:3]):
-            print(f"   Pool {i+1}: {p.get('dexId')} - ${float(p.get('priceUsd', 0)):.10f}")
-
-
-def demo_geckoterminal():
+    with _buffered_output() as out:
+        print(_HEADER_FMT.format(title="DEXSCREENER API DEMO"), file=out)
+        
+        async with DexScreenerAPI(session) as api:
+            # Both lookups are independent, so run them concurrently
+            results, pairs = await asyncio.gather(
+                api.search_token("BONK"),
+                api.get_token_pairs(BONK_ADDRESS)
+            )
+            
+            # Search for a token
+            print("\n1. Searching for 'BONK'...", file=out)
+            if results:
+                print(f"   Found {len(results)} pairs", file=out)
+                pair = results[0]
+                print(f"   Top result: {pair['baseToken']['symbol']} - ${pair.get('priceUsd', 'N/A')}", file=out)
+                print(f"   Market Cap: ${pair.get('marketCap', 0):,.0f}", file=out)
+                print(f"   DEX: {pair.get('dexId')}", file=out)
+            
+            # Get token pairs by address (BONK token)
+            print(f"\n2. Getting pairs for BONK ({BONK_ADDRESS[:20]}...)...", file=out)
+            if pairs:
+                print(f"   Found {len(pairs)} pools", file=out)
+                lines = [
+                    f"   Pool {i}: {p.get('dexId')} - ${float(p.get('priceUsd') or 0):.10f}"
+                    for i, p in enumerate(pairs[:3], 1)
+                ]
+                out.write("\n".join(lines) + "\n")
+
+
+async def demo_geckoterminal(session: Optional[aiohttp.ClientSession] = None):
     """Demonstrate GeckoTerminal API usage"""
-    print("\n" + "="*60)
-    print("GECKOTERMINAL API DEMO")
-    print("="*60)
-    
-    api = GeckoTerminalAPI()
-    
-    # Search for pools
-    print("\n1. Searching for 'BONK' pools...")
-    pools = api.search_pools("BONK")
-    if pools:
-        print(f"   Found {len(pools)} pools")
-        pool = pools[0]
-        attrs = pool.get("attributes", {})
-        print(f"   Top pool: {attrs.get('name')}")
-        print(f"   Address: {attrs.get('address')}")
-    
-    # Get OHLCV data
-    # Using a known BONK/SOL pool address
-    pool_address = "Gk9CfaWVY9y6wbfHqnDtMnLG5QJNquUxY7hcLc6NPv9P"
-    print(f"\n2. Getting OHLCV data for pool {pool_address[:20]}...")
-    ohlcv = api.get_ohlcv(pool_address, timeframe="hour", limit=24)
-    if ohlcv:
-        print(f"   Got {len(ohlcv)} candles")
-        latest = ohlcv[0]  # Most recent
-        print(f"   Latest candle:")
-        print(f"   - Time: {datetime.fromtimestamp(latest[0]).isoformat()}")
-        print(f"   - Open: ${latest[1]:.10f}")
-        print(f"   - High: ${latest[2]:.10f}")
-        print(f"   - Low: ${latest[3]:.10f}")
-        print(f"   - Close: ${latest[4]:.10f}")
-        print(f"   - Volume: ${latest[5]:,.2f}")
-
-
-def demo_trade_tracking():
+    with _buffered_output() as out:
+        print(_HEADER_FMT.format(title="GECKOTERMINAL API DEMO"), file=out)
+        
+        async with GeckoTerminalAPI(session) as api:
+            # Both requests are independent, so run them concurrently
+            pools, ohlcv = await asyncio.gather(
+                api.search_pools("BONK"),
+                api.get_ohlcv(BONK_POOL, timeframe="hour", limit=24)
+            )
+            
+            # Search for pools
+            print("\n1. Searching for 'BONK' pools...", file=out)
+            if pools:
+                print(f"   Found {len(pools)} pools", file=out)
+                pool = pools[0]
+                attrs = pool.get("attributes", {})
+                print(f"   Top pool: {attrs.get('name')}", file=out)
+                print(f"   Address: {attrs.get('address')}", file=out)
+            
+            # Get OHLCV data
+            print(f"\n2. Getting OHLCV data for pool {BONK_POOL[:20]}...", file=out)
+            if len(ohlcv):
+                print(f"   Got {len(ohlcv)} candles", file=out)
+                ts, open_, high, low, close, volume = ohlcv[0][:6]  # Most recent
+                out.write(_CANDLE_TMPL.format(
+                    time=datetime.fromtimestamp(ts).isoformat(),
+                    open=open_, high=high, low=low, close=close, volume=volume
+                ))
+
+
+async def demo_trade_tracking(session: Optional[aiohttp.ClientSession] = None):
     """Demonstrate trade tracking workflow"""
-    print("\n" + "="*60)
-    print("TRADE TRACKING DEMO")
-    print("="*60)
-    
-    tracker = WalletTracker()
-    
-    # Example: Add a manual trade
-    print("\n1. Adding a sample trade...")
-    
-    try:
-        trade = tracker.add_manual_trade(
-            token_address="DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263",  # BONK
-            buy_price=0.00003,
-            buy_amount_usd=100,
-            buy_timestamp="2024-01-15T10:00:00Z",
-            sell_price=0.00004,
-            sell_amount_usd=133,
-            sell_timestamp="2024-01-20T15:00:00Z",
-            notes="BONK memecoin trade"
-        )
-        
-        print(f"   Added trade: {trade.token_symbol}")
-        
-        # Analyze the trade
-        print("\n2. Analyzing trade performance...")
-        tracker.analyze_all_trades()
+    with _buffered_output() as out:
+        print(_HEADER_FMT.format(title="TRADE TRACKING DEMO"), file=out)
         
-        # Print report
-        tracker.print_trade_report(tracker.trades[0])
-        
-        # Get portfolio summary
-        summary = tracker.get_portfolio_summary()
-        print("\n3. Portfolio Summary:")
-        for key, value in summary.items():
-            if isinstance(value, float):
-                print(f"   {key}: {value:.2f}")
-            else:
-                print(f"   {key}: {value}")
-        
-        # Check post-sell performance
-        print("\n4. Checking post-sell performance...")
-        post_sell = tracker.analyzer.get_post_sell_performance(trade)
-        if post_sell:
-            print(f"   Current price: ${post_sell['current_price']:.10f}")
-            print(f"   Change since sell: {post_sell['price_change_since_sell']:+.2f}%")
-            if post_sell['missed_gains'] > 0:
-                print(f"   😢 Missed gains: {post_sell['missed_gains']:.2f}%")
-            else:
-                print(f"   🎯 Avoided loss: {post_sell['avoided_loss']:.2f}%")
-    
-    except Exception as e:
-        print(f"   Error: {e}")
+        async with WalletTracker(session=session) as tracker:
+            # Example: Add a manual trade
+            print("\n1. Adding a sample trade...", file=out)
+            
+            try:
+                trade = await tracker.add_manual_trade(**_BONK_TRADE_KW)
+                
+                print(f"   Added trade: {trade.token_symbol}", file=out)
+                
+                # Analyze the trade
+                print("\n2. Analyzing trade performance...", file=out)
+                await tracker.analyze_all_trades(file=out)
+                
+                # Print report
+                tracker.print_trade_report(tracker.trades[0], file=out)
+                
+                # Get portfolio summary
+                summary = tracker.get_portfolio_summary()
+                print("\n3. Portfolio Summary:", file=out)
+                # Summary values are plain ints and floats, so an exact type check is enough
+                lines = [
+                    f"   {key}: {value:.2f}" if type(value) is float else f"   {key}: {value}"
+                    for key, value in summary.items()
+                ]
+                print("\n".join(lines), file=out)
+                
+                # Check post-sell performance
+                print("\n4. Checking post-sell performance...", file=out)
+                post_sell = (await tracker.get_all_post_sell_performance())[0]
+                if post_sell:
+                    print(f"   Current price: ${post_sell['current_price']:.10f}", file=out)
+                    print(f"   Change since sell: {post_sell['price_change_since_sell']:+.2f}%", file=out)
+                    if post_sell['missed_gains'] > 0:
+                        print(f"   😢 Missed gains: {post_sell['missed_gains']:.2f}%", file=out)
+                    else:
+                        print(f"   🎯 Avoided loss: {post_sell['avoided_loss']:.2f}%", file=out)
+            
+            # Expected failures: unknown token, bad timestamps, network errors
+            # (timeouts included). Anything else is a bug and should surface
+            except (KeyError, ValueError, aiohttp.ClientError) as e:
+                print(f"   Error: {e}", file=out)
+
+
+# Demos selectable with --only
+DEMOS = {
+    "dex": demo_dexscreener,
+    "gecko": demo_geckoterminal,
+    "trade": demo_trade_tracking,
+}
+
 
+_BANNER = _HEADER_FMT.format(title="SOLANA WALLET TRACKER") + """
 
-def main():
-    """Main function"""
-    print("\n" + "="*60)
-    print("SOLANA WALLET TRACKER")
-    print("="*60)
-    print("""
 This script demonstrates how to:
 1. Use DexScreener API for token data
 2. Use GeckoTerminal API for historical prices
@@ -920,17 +1508,30 @@ APIs Used:
 For automatic wallet tracking, you need:
 - Helius API key (helius.dev)
 - Or Solana Tracker API (solanatracker.io)
-""")
-    
-    # Run demos
-    demo_dexscreener()
-    time.sleep(2)  # Rate limit buffer
-    
-    demo_geckoterminal()
-    time.sleep(2)
+
+"""
+
+
+async def main(only: Optional[str] = None):
+    """Main function (runs every demo unless `only` names one of DEMOS)"""
+    sys.stdout.write(_BANNER)
     
-    demo_trade_tracking()
+    # Run demos concurrently over one shared connection pool; pacing is left
+    # to the per-host limiters and each demo writes its output in one block
+    demos = [DEMOS[only]] if only else list(DEMOS.values())
+    async with create_session() as session:
+        await asyncio.gather(*[demo(session) for demo in demos])
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Solana wallet tracker demos")
+    parser.add_argument("--only", choices=DEMOS, help="run a single demo")
+    args = parser.parse_args()
+    if uvloop and sys.version_info >= (3, 11):
+        # uvloop.install() is deprecated from Python 3.12
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(main(args.only))
+    else:
+        if uvloop:
+            uvloop.install()
+        asyncio.run(main(args.only))